@@ -107,7 +107,7 @@ class ConditionalSection:
                 upstream_nodes=list(upstream_nodes),  # type: ignore
                 flyte_entity=node,
             )
-            FlyteContextManager.current_context().compilation_state.add_node(n)  # type: ignore
+            ctx.compilation_state.add_node(n)  # type: ignore
             return self._compute_outputs(n)
         return self._condition
 
@@ -182,10 +182,12 @@ class ComparisonExpression(object):
             if rhs.is_ready:
                 if rhs.val.scalar is None or rhs.val.scalar.primitive is None:
                     raise ValueError("Only primitive values can be used in comparison")
-        if self._lhs is None:
-            self._lhs = type_engine.TypeEngine.to_literal(FlyteContextManager.current_context(), lhs, type(lhs), None)
-        if self._rhs is None:
-            self._rhs = type_engine.TypeEngine.to_literal(FlyteContextManager.current_context(), rhs, type(rhs), None)
+        if self._lhs is None or self._rhs is None:
+            ctx = FlyteContextManager.current_context()
+            if self._lhs is None:
+                self._lhs = type_engine.TypeEngine.to_literal(ctx, lhs, type(lhs), None)
+            if self._rhs is None:
+                self._rhs = type_engine.TypeEngine.to_literal(ctx, rhs, type(rhs), None)
 
     @property
     def rhs(self) -> Union["Promise", _literal_models.Literal]:
@@ -778,8 +780,10 @@ def create_and_link_node_from_remote(
     if ctx.compilation_state is None:
         raise _user_exceptions.FlyteAssertion("Cannot create node when not compiling...")
 
-    used_inputs = set()
     bindings = []
+    # Detect upstream nodes while binding the inputs.
+    # These will be our core Nodes until we can amend the Promise to use NodeOutputs that reference our Nodes
+    upstream_nodes = set()
 
     typed_interface = entity.interface
 
@@ -797,6 +801,8 @@ def create_and_link_node_from_remote(
                 f"Variable({k}) for function({entity.name}) cannot receive a multi-valued tuple {v}."
                 f" Check if the predecessor function returning more than one value?"
             )
+        if isinstance(v, Promise) and v.ref.node_id != _common_constants.GLOBAL_INPUT_NODE_ID:
+            upstream_nodes.add(v.ref.node)
         try:
             bindings.append(
                 binding_from_flyte_std(
@@ -806,34 +812,21 @@ def create_and_link_node_from_remote(
                     t_value=v,
                 )
             )
-            used_inputs.add(k)
         except Exception as e:
             raise AssertionError(f"Failed to Bind variable {k} for function {entity.name}.") from e
 
-    extra_inputs = used_inputs ^ set(kwargs.keys())
+    extra_inputs = kwargs.keys() - typed_interface.inputs.keys()
     if len(extra_inputs) > 0:
         raise _user_exceptions.FlyteAssertion(
             "Too many inputs were specified for the interface.  Extra inputs were: {}".format(extra_inputs)
         )
 
-    # Detect upstream nodes
-    # These will be our core Nodes until we can amend the Promise to use NodeOutputs that reference our Nodes
-    upstream_nodes = list(
-        set(
-            [
-                input_val.ref.node
-                for input_val in kwargs.values()
-                if isinstance(input_val, Promise) and input_val.ref.node_id != _common_constants.GLOBAL_INPUT_NODE_ID
-            ]
-        )
-    )
-
     flytekit_node = Node(
         # TODO: Better naming, probably a derivative of the function name.
         id=f"{ctx.compilation_state.prefix}n{len(ctx.compilation_state.nodes)}",
         metadata=entity.construct_node_metadata(),
-        bindings=sorted(bindings, key=lambda b: b.var),
-        upstream_nodes=upstream_nodes,
+        bindings=bindings,
+        upstream_nodes=list(upstream_nodes),
         flyte_entity=entity,
     )
     ctx.compilation_state.add_node(flytekit_node)
@@ -842,9 +835,9 @@ def create_and_link_node_from_remote(
         return VoidPromise(entity.name)
 
     # Create a node output object for each output, they should all point to this node of course.
-    node_outputs = []
-    for output_name, output_var_model in typed_interface.outputs.items():
-        node_outputs.append(Promise(output_name, NodeOutput(node=flytekit_node, var=output_name)))
+    node_outputs = [
+        Promise(output_name, NodeOutput(node=flytekit_node, var=output_name)) for output_name in typed_interface.outputs
+    ]
 
     return create_task_output(node_outputs)
 
@@ -860,8 +853,10 @@ def create_and_link_node(
     if ctx.compilation_state is None:
         raise _user_exceptions.FlyteAssertion("Cannot create node when not compiling...")
 
-    used_inputs = set()
     bindings = []
+    # Detect upstream nodes while binding the inputs.
+    # These will be our core Nodes until we can amend the Promise to use NodeOutputs that reference our Nodes
+    upstream_nodes = set()
 
     interface = entity.python_interface
     typed_interface = flyte_interface.transform_interface_to_typed_interface(interface)
@@ -881,40 +876,29 @@ def create_and_link_node(
                 f"Variable({k}) for function({entity.name}) cannot receive a multi-valued tuple {v}."
                 f" Check if the predecessor function returning more than one value?"
             )
+        if isinstance(v, Promise) and v.ref.node_id != _common_constants.GLOBAL_INPUT_NODE_ID:
+            upstream_nodes.add(v.ref.node)
         try:
             bindings.append(
                 binding_from_python_std(
                     ctx, var_name=k, expected_literal_type=var.type, t_value=v, t_value_type=interface.inputs[k]
                 )
             )
-            used_inputs.add(k)
         except Exception as e:
             raise AssertionError(f"Failed to Bind variable {k} for function {entity.name}.") from e
 
-    extra_inputs = used_inputs ^ set(kwargs.keys())
+    extra_inputs = kwargs.keys() - interface.inputs.keys()
     if len(extra_inputs) > 0:
         raise _user_exceptions.FlyteAssertion(
             "Too many inputs were specified for the interface.  Extra inputs were: {}".format(extra_inputs)
         )
 
-    # Detect upstream nodes
-    # These will be our core Nodes until we can amend the Promise to use NodeOutputs that reference our Nodes
-    upstream_nodes = list(
-        set(
-            [
-                input_val.ref.node
-                for input_val in kwargs.values()
-                if isinstance(input_val, Promise) and input_val.ref.node_id != _common_constants.GLOBAL_INPUT_NODE_ID
-            ]
-        )
-    )
-
     flytekit_node = Node(
         # TODO: Better naming, probably a derivative of the function name.
         id=f"{ctx.compilation_state.prefix}n{len(ctx.compilation_state.nodes)}",
         metadata=entity.construct_node_metadata(),
-        bindings=sorted(bindings, key=lambda b: b.var),
-        upstream_nodes=upstream_nodes,
+        bindings=bindings,
+        upstream_nodes=list(upstream_nodes),
         flyte_entity=entity,
     )
     ctx.compilation_state.add_node(flytekit_node)
@@ -923,10 +907,9 @@ def create_and_link_node(
         return VoidPromise(entity.name)
 
     # Create a node output object for each output, they should all point to this node of course.
-    node_outputs = []
-    for output_name, output_var_model in typed_interface.outputs.items():
-        node_outputs.append(Promise(output_name, NodeOutput(node=flytekit_node, var=output_name)))
-        # Don't print this, it'll crash cuz sdk_node._upstream_node_ids might be None, but idl code will break
+    node_outputs = [
+        Promise(output_name, NodeOutput(node=flytekit_node, var=output_name)) for output_name in typed_interface.outputs
+    ]
 
     return create_task_output(node_outputs, interface)
 
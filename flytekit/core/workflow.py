@@ -3,7 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from functools import update_wrapper
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, Union
 
 from flytekit.core import constants as _common_constants
 from flytekit.core.base_task import PythonTask
@@ -38,6 +39,7 @@ from flytekit.exceptions.user import FlyteValidationException, FlyteValueExcepti
 from flytekit.loggers import logger
 from flytekit.models import interface as _interface_models
 from flytekit.models import literals as _literal_models
+from flytekit.models import types as _type_models
 from flytekit.models.core import workflow as _workflow_model
 
 GLOBAL_START_NODE = Node(
@@ -48,6 +50,17 @@ GLOBAL_START_NODE = Node(
     flyte_entity=None,
 )
 
+# The workflow metadata models only carry the failure policy and the interruptible flag and are never modified after
+# construction, so every workflow shares one instance per possible value instead of building them at serialization.
+_FLYTE_WORKFLOW_METADATA = (
+    _workflow_model.WorkflowMetadata(on_failure=0),
+    _workflow_model.WorkflowMetadata(on_failure=1),
+)
+_FLYTE_WORKFLOW_METADATA_DEFAULTS = {
+    False: _workflow_model.WorkflowMetadataDefaults(interruptible=False),
+    True: _workflow_model.WorkflowMetadataDefaults(interruptible=True),
+}
+
 
 class WorkflowFailurePolicy(Enum):
     """
@@ -77,10 +90,8 @@ class WorkflowMetadata(object):
 
     def to_flyte_model(self):
         if self.on_failure == WorkflowFailurePolicy.FAIL_IMMEDIATELY:
-            on_failure = 0
-        else:
-            on_failure = 1
-        return _workflow_model.WorkflowMetadata(on_failure=on_failure)
+            return _FLYTE_WORKFLOW_METADATA[0]
+        return _FLYTE_WORKFLOW_METADATA[1]
 
 
 @dataclass
@@ -99,7 +110,7 @@ class WorkflowMetadataDefaults(object):
             raise FlyteValidationException(f"Interruptible must be boolean, {self.interruptible} invalid")
 
     def to_flyte_model(self):
-        return _workflow_model.WorkflowMetadataDefaults(interruptible=self.interruptible)
+        return _FLYTE_WORKFLOW_METADATA_DEFAULTS[self.interruptible]
 
 
 def construct_input_promises(inputs: List[str]):
@@ -109,6 +120,30 @@ def construct_input_promises(inputs: List[str]):
     }
 
 
+def _transform_workflow_function_interfaces(
+    workflow_function: Callable, docstring: Optional[Docstring] = None
+) -> Tuple[Interface, _interface_models.TypedInterface]:
+    """
+    Signature inspection and type hint resolution are comparatively expensive, and the same function can be turned into
+    a workflow many times over (dynamic tasks do this on every execution). The interfaces are therefore stored on the
+    function object itself and reused as long as the code object and the docstring are the same ones.
+    """
+    code = getattr(workflow_function, "__code__", None)
+    cached = getattr(workflow_function, "__flyte_iface_cache__", None)
+    if cached is not None and code is not None and cached[0] is code and cached[1] is docstring:
+        return cached[2], cached[3]
+
+    native_interface = transform_function_to_interface(workflow_function, docstring=docstring)
+    typed_interface = transform_interface_to_typed_interface(native_interface)
+    if code is not None:
+        try:
+            workflow_function.__flyte_iface_cache__ = (code, docstring, native_interface, typed_interface)
+        except AttributeError:
+            # Some callables (bound methods for instance) don't allow setting attributes, just don't cache those.
+            pass
+    return native_interface, typed_interface
+
+
 def get_promise(binding_data: _literal_models.BindingData, outputs_cache: Dict[Node, Dict[str, Promise]]) -> Promise:
     """
     This is a helper function that will turn a binding into a Promise object, using a lookup map. Please see
@@ -168,13 +203,14 @@ class WorkflowBase(object):
         workflow_metadata: WorkflowMetadata,
         workflow_metadata_defaults: WorkflowMetadataDefaults,
         python_interface: Interface,
+        typed_interface: Optional[_interface_models.TypedInterface] = None,
         **kwargs,
     ):
         self._name = name
         self._workflow_metadata = workflow_metadata
         self._workflow_metadata_defaults = workflow_metadata_defaults
         self._python_interface = python_interface
-        self._interface = transform_interface_to_typed_interface(python_interface)
+        self._interface = typed_interface or transform_interface_to_typed_interface(python_interface)
         self._inputs = {}
         self._unbound_inputs = set()
         self._nodes = []
@@ -243,10 +279,11 @@ class WorkflowBase(object):
     def local_execute(self, ctx: FlyteContext, **kwargs) -> Union[Tuple[Promise], Promise, VoidPromise]:
         # This is done to support the invariant that Workflow local executions always work with Promise objects
         # holding Flyte literal values. Even in a wf, a user can call a sub-workflow with a Python native value.
+        native_inputs = self.python_interface.inputs
+        typed_inputs = self.interface.inputs
         for k, v in kwargs.items():
             if not isinstance(v, Promise):
-                t = self.python_interface.inputs[k]
-                kwargs[k] = Promise(var=k, val=TypeEngine.to_literal(ctx, v, t, self.interface.inputs[k].type))
+                kwargs[k] = Promise(var=k, val=TypeEngine.to_literal(ctx, v, native_inputs[k], typed_inputs[k].type))
 
         # The output of this will always be a combination of Python native values and Promises containing Flyte
         # Literals.
@@ -260,30 +297,31 @@ class WorkflowBase(object):
         #   def wf():
         #       t1()
         # In the former case we get the task's VoidPromise, in the latter we get None
+        python_interface = self.python_interface
+        native_outputs = python_interface.outputs
         if isinstance(function_outputs, VoidPromise) or function_outputs is None:
-            if len(self.python_interface.outputs) != 0:
+            if len(native_outputs) != 0:
                 raise FlyteValueException(
                     function_outputs,
-                    f"Interface has {len(self.python_interface.outputs)} outputs.",
+                    f"Interface has {len(native_outputs)} outputs.",
                 )
             return VoidPromise(self.name)
 
         # Because we should've already returned in the above check, we just raise an error here.
-        if len(self.python_interface.outputs) == 0:
+        if len(native_outputs) == 0:
             raise FlyteValueException(function_outputs, "Interface output should've been VoidPromise or None.")
 
-        expected_output_names = list(self.python_interface.outputs.keys())
+        expected_output_names = list(native_outputs.keys())
         if len(expected_output_names) == 1:
             # Here we have to handle the fact that the wf could've been declared with a typing.NamedTuple of
             # length one. That convention is used for naming outputs - and single-length-NamedTuples are
             # particularly troublesome but elegant handling of them is not a high priority
             # Again, we're using the output_tuple_name as a proxy.
-            if self.python_interface.output_tuple_name and isinstance(function_outputs, tuple):
-                wf_outputs_as_map = {expected_output_names[0]: function_outputs[0]}
-            else:
-                wf_outputs_as_map = {expected_output_names[0]: function_outputs}
+            if python_interface.output_tuple_name and isinstance(function_outputs, tuple):
+                function_outputs = function_outputs[0]
+            wf_outputs_as_map = {expected_output_names[0]: function_outputs}
         else:
-            wf_outputs_as_map = {expected_output_names[i]: function_outputs[i] for i, _ in enumerate(function_outputs)}
+            wf_outputs_as_map = {expected_output_names[i]: v for i, v in enumerate(function_outputs)}
 
         # Basically we need to repackage the promises coming from the tasks into Promises that match the workflow's
         # interface. We do that by extracting out the literals, and creating new Promises
@@ -291,12 +329,16 @@ class WorkflowBase(object):
             ctx,
             wf_outputs_as_map,
             flyte_interface_types=self.interface.outputs,
-            native_types=self.python_interface.outputs,
+            native_types=native_outputs,
         )
         # Recreate new promises that use the workflow's output names.
         new_promises = [Promise(var, wf_outputs_as_literal_dict[var]) for var in expected_output_names]
 
-        return create_task_output(new_promises, self.python_interface)
+        # A single output that isn't a one-element NamedTuple is returned as the bare Promise, which is what
+        # create_task_output would do, so skip it.
+        if len(new_promises) == 1 and not python_interface.output_tuple_name:
+            return new_promises[0]
+        return create_task_output(new_promises, python_interface)
 
 
 class ImperativeWorkflow(WorkflowBase):
@@ -517,7 +559,7 @@ class ImperativeWorkflow(WorkflowBase):
                     f" starting with the container type (e.g. List[int]"
                 )
             python_type = p.ref.node.flyte_entity.python_interface.outputs[p.var]
-            logger.debug(f"Inferring python type for wf output {output_name} from Promise provided {python_type}")
+            logger.debug("Inferring python type for wf output %s from Promise provided %s", output_name, python_type)
 
         flyte_type = TypeEngine.to_literal_type(python_type=python_type)
 
@@ -575,17 +617,28 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
     ):
         name, _, _, _ = extract_task_module(workflow_function)
         self._workflow_function = workflow_function
-        native_interface = transform_function_to_interface(workflow_function, docstring=docstring)
+        native_interface, typed_interface = _transform_workflow_function_interfaces(workflow_function, docstring)
 
         # TODO do we need this - can this not be in launchplan only?
         #    This can be in launch plan only, but is here only so that we don't have to re-evaluate. Or
         #    we can re-evaluate.
         self._input_parameters = None
+        # The input promises handed to the workflow function during compilation. These only depend on the interface,
+        # which doesn't change after construction, so they're built once on first compile and shared thereafter.
+        self._input_promises: Optional[Mapping[str, Promise]] = None
+        # The output names and their native and literal types, in interface order, so compile() can index into them
+        # instead of re-reading both interfaces for every output.
+        self._output_names: Tuple[str, ...] = tuple(native_interface.outputs.keys())
+        self._output_types: Tuple[Type, ...] = tuple(native_interface.outputs.values())
+        self._output_literal_types: Tuple[_type_models.LiteralType, ...] = tuple(
+            typed_interface.outputs[n].type for n in self._output_names
+        )
         super().__init__(
             name=name,
             workflow_metadata=metadata,
             workflow_metadata_defaults=default_metadata,
             python_interface=native_interface,
+            typed_interface=typed_interface,
         )
 
     @property
@@ -609,7 +662,9 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
             ctx.with_compilation_state(CompilationState(prefix=prefix, task_resolver=self))
         ) as comp_ctx:
             # Construct the default input promise bindings, but then override with the provided inputs, if any
-            input_kwargs = construct_input_promises([k for k in self.interface.inputs.keys()])
+            if self._input_promises is None:
+                self._input_promises = MappingProxyType(construct_input_promises(list(self.interface.inputs.keys())))
+            input_kwargs = dict(self._input_promises)
             input_kwargs.update(kwargs)
             workflow_outputs = exception_scopes.user_entry_point(self._workflow_function)(**input_kwargs)
             all_nodes.extend(comp_ctx.compilation_state.nodes)
@@ -621,12 +676,12 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
             # object itself.
             for n in comp_ctx.compilation_state.nodes:
                 if isinstance(n.flyte_entity, PythonAutoContainerTask) and n.flyte_entity.task_resolver == self:
-                    logger.debug(f"WF {self.name} saving task {n.flyte_entity.name}")
+                    logger.debug("WF %s saving task %s", self.name, n.flyte_entity.name)
                     self.add(n.flyte_entity)
 
         # Iterate through the workflow outputs
         bindings = []
-        output_names = list(self.interface.outputs.keys())
+        output_names = self._output_names
         # The reason the length 1 case is separate is because the one output might be a list. We don't want to
         # iterate through the list here, instead we should let the binding creation unwrap it and make a binding
         # collection/map out of it.
@@ -641,13 +696,12 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
                         "Outputs specification for Workflow does not define a tuple, but return value is a tuple"
                     )
                 workflow_outputs = workflow_outputs[0]
-            t = self.python_interface.outputs[output_names[0]]
             b = binding_from_python_std(
                 ctx,
                 output_names[0],
-                self.interface.outputs[output_names[0]].type,
+                self._output_literal_types[0],
                 workflow_outputs,
-                t,
+                self._output_types[0],
             )
             bindings.append(b)
         elif len(output_names) > 1:
@@ -655,16 +709,15 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
                 raise AssertionError("The Workflow specification indicates multiple return values, received only one")
             if len(output_names) != len(workflow_outputs):
                 raise Exception(f"Length mismatch {len(output_names)} vs {len(workflow_outputs)}")
+            if any(isinstance(o, ConditionalSection) for o in workflow_outputs):
+                raise AssertionError("A Conditional block (if-else) should always end with an `else_()` clause")
             for i, out in enumerate(output_names):
-                if isinstance(workflow_outputs[i], ConditionalSection):
-                    raise AssertionError("A Conditional block (if-else) should always end with an `else_()` clause")
-                t = self.python_interface.outputs[out]
                 b = binding_from_python_std(
                     ctx,
                     out,
-                    self.interface.outputs[out].type,
+                    self._output_literal_types[i],
                     workflow_outputs[i],
-                    t,
+                    self._output_types[i],
                 )
                 bindings.append(b)
 
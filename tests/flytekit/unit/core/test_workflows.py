@@ -9,8 +9,15 @@ import flytekit.configuration
 from flytekit import StructuredDataset, kwtypes
 from flytekit.configuration import Image, ImageConfig
 from flytekit.core.condition import conditional
+from flytekit.core.docstring import Docstring
 from flytekit.core.task import task
-from flytekit.core.workflow import WorkflowFailurePolicy, WorkflowMetadata, WorkflowMetadataDefaults, workflow
+from flytekit.core.workflow import (
+    PythonFunctionWorkflow,
+    WorkflowFailurePolicy,
+    WorkflowMetadata,
+    WorkflowMetadataDefaults,
+    workflow,
+)
 from flytekit.exceptions.user import FlyteValidationException, FlyteValueException
 from flytekit.tools.translator import get_serializable
 from flytekit.types.schema import FlyteSchema
@@ -46,6 +53,49 @@ def test_default_metadata_values():
     assert wm.interruptible is False
 
 
+def test_interface_reuse():
+    @task
+    def t1(a: int) -> int:
+        return a + 2
+
+    def my_wf(a: int) -> int:
+        return t1(a=a)
+
+    wm = WorkflowMetadata(on_failure=WorkflowFailurePolicy.FAIL_IMMEDIATELY)
+    wmd = WorkflowMetadataDefaults(interruptible=False)
+    wf_1 = PythonFunctionWorkflow(my_wf, metadata=wm, default_metadata=wmd)
+    wf_2 = PythonFunctionWorkflow(my_wf, metadata=wm, default_metadata=wmd)
+    assert wf_1.python_interface is wf_2.python_interface
+    assert wf_1.interface is wf_2.interface
+    assert wf_2.python_interface.inputs == {"a": int}
+
+    # A different docstring results in a different interface
+    wf_3 = PythonFunctionWorkflow(
+        my_wf, metadata=wm, default_metadata=wmd, docstring=Docstring(docstring=":param a: A")
+    )
+    assert wf_3.python_interface is not wf_1.python_interface
+    assert wf_3.interface.inputs["a"].description == "A"
+
+
+def test_input_promises_reused_across_compiles():
+    seen = []
+
+    @task
+    def t1(a: int) -> int:
+        return a + 2
+
+    @workflow
+    def my_wf(a: int) -> int:
+        seen.append(a)
+        return t1(a=a)
+
+    my_wf.compile()
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+    assert not seen[0].is_ready
+    assert my_wf(a=3) == 5
+
+
 def test_workflow_values():
     @task
     def t1(a: int) -> typing.NamedTuple("OutputsBC", t1_int_output=int, c=str):